@@ -9,18 +9,31 @@ Run with:
 
 from __future__ import annotations
 
+import html
 import json
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
 
 import streamlit as st
-from nltk.corpus import words as nltk_words
+
+try:
+    import orjson
+except ImportError:  # optional – fall back to the stdlib encoder
+    orjson = None
 
 from password_generators import (
+    CHARSET_DIGITS,
+    CHARSET_LOWER,
+    CHARSET_SYMBOLS,
+    CHARSET_UPPER,
     MemorablePasswordGenerator,
     PasswordGenerator,
-    PinCodeGenerator,
-    RandomPasswordGenerator,
-    _ensure_nltk_words,
+    _get_filtered_words,
+    get_memorable_generator,
+    get_pin_generator,
+    get_random_generator,
 )
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -38,124 +51,19 @@ st.set_page_config(
 # Custom CSS – dark, modern, minimal
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _inject_css() -> None:
-    st.markdown(
-        """
-        <style>
-        /* ── Global ── */
-        [data-testid="stAppViewContainer"],
-        [data-testid="stHeader"],
-        [data-testid="stToolbar"],
-        section.main { background-color: #060d1a !important; }
-
-        /* ── Text ── */
-        h1, h2, h3, h4, p, label, span, div, li, .stMarkdown {
-            color: #e8f0fe !important;
-        }
-
-        /* ── Code blocks (password display) ── */
-        code, .stCode pre {
-            background-color: #0d1f3c !important;
-            color: #67e8f9 !important;
-            border: 1px solid rgba(103,232,249,0.25) !important;
-            border-radius: 10px !important;
-            font-family: 'JetBrains Mono', 'Fira Code', monospace !important;
-            font-size: 1.05rem !important;
-            letter-spacing: 0.04em !important;
-        }
-
-        /* ── Buttons ── */
-        .stButton > button {
-            background: linear-gradient(135deg, #0ea5e9, #6366f1) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 12px !important;
-            font-weight: 700 !important;
-            letter-spacing: 0.04em !important;
-            padding: 0.6rem 1.4rem !important;
-            transition: transform 0.15s, box-shadow 0.15s !important;
-        }
-        .stButton > button:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 24px rgba(14,165,233,0.35) !important;
-        }
-
-        /* ── Sliders ── */
-        .stSlider > div > div > div > div {
-            background: linear-gradient(135deg, #0ea5e9, #6366f1) !important;
-        }
-
-        /* ── Progress bar (strength) ── */
-        .stProgress > div > div > div > div {
-            border-radius: 100px !important;
-        }
-
-        /* ── Expanders ── */
-        .streamlit-expanderHeader {
-            background-color: #0d1f3c !important;
-            border-radius: 10px !important;
-            border: 1px solid rgba(103,232,249,0.15) !important;
-            font-weight: 600 !important;
-        }
-        .streamlit-expanderContent {
-            background-color: #07121f !important;
-            border: 1px solid rgba(103,232,249,0.1) !important;
-            border-top: none !important;
-            border-radius: 0 0 10px 10px !important;
-        }
+_CSS_PATH = Path(__file__).with_name("static") / "passgen.css"
 
-        /* ── Radio buttons ── */
-        .stRadio > div { gap: 0.75rem !important; }
-        .stRadio label { font-weight: 500 !important; }
 
-        /* ── Checkboxes ── */
-        .stCheckbox label { font-weight: 500 !important; }
-
-        /* ── Metric cards ── */
-        [data-testid="metric-container"] {
-            background-color: #0d1f3c !important;
-            border: 1px solid rgba(103,232,249,0.18) !important;
-            border-radius: 12px !important;
-            padding: 0.75rem 1rem !important;
-        }
-        [data-testid="metric-container"] label {
-            font-size: 0.72rem !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.1em !important;
-            color: #64748b !important;
-        }
-        [data-testid="stMetricValue"] {
-            color: #67e8f9 !important;
-            font-family: 'JetBrains Mono', monospace !important;
-            font-weight: 800 !important;
-        }
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Read the stylesheet once per process and wrap it in a ``<style>`` tag."""
+    return f"<style>\n{_CSS_PATH.read_text(encoding='utf-8')}</style>"
 
-        /* ── Download buttons ── */
-        .stDownloadButton > button {
-            background: #0d1f3c !important;
-            color: #67e8f9 !important;
-            border: 1px solid rgba(103,232,249,0.3) !important;
-            border-radius: 10px !important;
-            font-weight: 600 !important;
-        }
-        .stDownloadButton > button:hover {
-            border-color: #67e8f9 !important;
-            transform: translateY(-1px) !important;
-        }
 
-        /* ── Divider ── */
-        hr { border-color: rgba(103,232,249,0.12) !important; }
-
-        /* ── Info / Success / Warning boxes ── */
-        .stAlert { border-radius: 10px !important; }
-
-        /* ── Scrollbar ── */
-        ::-webkit-scrollbar { width: 6px; }
-        ::-webkit-scrollbar-thumb { background: #1e3a5f; border-radius: 3px; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+def _inject_css() -> None:
+    # st.html routes a style-only body to the event container and skips the
+    # Markdown parser that st.markdown would run on every rerun.
+    st.html(_load_css())
 
 
 _inject_css()
@@ -164,10 +72,15 @@ _inject_css()
 # Session state initialisation
 # ─────────────────────────────────────────────────────────────────────────────
 
+_HISTORY_LIMIT = 30   # passwords kept in the session history
+_BATCH_SIZE    = 10   # passwords produced by the "Generate 10" button
+
 DEFAULTS = {
     "generator":      None,
     "password":       None,
-    "history":        [],
+    "history":        deque(maxlen=_HISTORY_LIMIT),
+    "_history_html":  "",     # pre-rendered <tr> rows, newest first
+    "_stats":         {},     # password -> PasswordStats, for passwords in history
     "last_type":      None,
 }
 
@@ -175,131 +88,244 @@ for key, value in DEFAULTS.items():
     if key not in st.session_state:
         st.session_state[key] = value
 
+# Sessions started before the history became bounded still hold a plain list
+if isinstance(st.session_state.history, list):
+    st.session_state.history = deque(
+        st.session_state.history[-_HISTORY_LIMIT:], maxlen=_HISTORY_LIMIT
+    )
+
 # ─────────────────────────────────────────────────────────────────────────────
 # NLTK word corpus (cached)
 # ─────────────────────────────────────────────────────────────────────────────
 
-@st.cache_data(show_spinner="Loading word corpus…")
-def load_word_list() -> list[str]:
-    """Return a filtered list of clean English words for memorable passwords."""
-    _ensure_nltk_words()
-    return [
-        w for w in nltk_words.words()
-        if 4 <= len(w) <= 8 and w.isalpha() and w.islower()
-    ]
+@st.cache_resource(show_spinner="Loading word corpus…")
+def load_word_list() -> tuple[str, ...]:
+    """
+    Return a filtered tuple of clean English words for memorable passwords.
+
+    The filtering itself is memoised in ``password_generators``; this wrapper
+    only adds the loading spinner and hands every rerun the same tuple.
+    """
+    return _get_filtered_words(
+        MemorablePasswordGenerator._WORD_MIN_LEN,
+        MemorablePasswordGenerator._WORD_MAX_LEN,
+    ).lower
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Strength helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-_STRENGTH_COLORS = {
-    "Weak":        "#ef4444",
-    "Medium":      "#f97316",
-    "Strong":      "#facc15",
-    "Very Strong": "#4ade80",
-}
+# Indexed by strength level: 0 Weak · 1 Medium · 2 Strong · 3 Very Strong
+_STRENGTH_LABELS = ("Weak",    "Medium",  "Strong",  "Very Strong")
+_STRENGTH_COLORS = ("#ef4444", "#f97316", "#facc15", "#4ade80")
+_STRENGTH_EMOJI  = ("🔴",      "🟠",      "🟡",      "🟢")
 
-_STRENGTH_EMOJI = {
-    "Weak":        "🔴",
-    "Medium":      "🟠",
-    "Strong":      "🟡",
-    "Very Strong": "🟢",
-}
 
+class PasswordStats(NamedTuple):
+    """All strength metrics shown for a single password."""
+    score:      int
+    label:      str
+    level:      int     # index into the _STRENGTH_* tuples
+    length:     int
+    charset:    int
+    entropy:    int
+    crack_time: str
 
-def _render_strength(password: str) -> None:
-    """Render animated strength bar + metrics below the password."""
+
+def _password_stats(password: str) -> PasswordStats:
+    """
+    Compute every strength metric for *password* once per session.
+
+    Results live in session state next to the history rather than in a
+    process-wide ``st.cache_*`` cache, so no password outlives the session
+    that generated it.  Entries are pruned with the history.
+    """
+    cache = st.session_state._stats
+    stats = cache.get(password)
+    if stats is None:
+        stats = cache[password] = _compute_stats(password)
+    return stats
+
+
+def _compute_stats(password: str) -> PasswordStats:
     score, label = PasswordGenerator.compute_strength(password)
-    color        = _STRENGTH_COLORS[label]
-    emoji        = _STRENGTH_EMOJI[label]
+    return PasswordStats(
+        score=score,
+        label=label,
+        level=_STRENGTH_LABELS.index(label),
+        length=len(password),
+        charset=PasswordGenerator.charset_size(password),
+        entropy=PasswordGenerator.entropy_bits(password),
+        crack_time=PasswordGenerator.crack_time_label(password),
+    )
 
-    # Strength bar row
-    col_label, col_bar = st.columns([1, 3])
-    with col_label:
-        st.markdown(
-            f"<h4 style='color:{color};margin:0'>{emoji} {label}</h4>",
-            unsafe_allow_html=True,
-        )
-    with col_bar:
-        st.progress(score / 100)
 
-    # Metric cards row
-    cs  = PasswordGenerator.charset_size(password)
-    ent = PasswordGenerator.entropy_bits(password)
-    ct  = PasswordGenerator.crack_time_label(password)
+def _render_strength(password: str) -> None:
+    """
+    Render the strength bar + metric cards below the password.
+
+    Everything is one HTML block kept in session state, so reruns that leave
+    the password unchanged re-emit the cached string instead of rebuilding
+    the columns, progress bar and four metric widgets.
+    """
+    cached = st.session_state.get("_strength_html")
+    if cached is None or cached[0] != password:
+        score, label, level, length, cs, ent, ct = _password_stats(password)
+        color   = _STRENGTH_COLORS[level]
+        metrics = "".join(
+            f"<div class='passgen-metric'><label>{name}</label><span>{value}</span></div>"
+            for name, value in (
+                ("Length",     length),
+                ("Entropy",    f"{ent} bits"),
+                ("Charset",    cs),
+                ("Crack Time", html.escape(ct)),
+            )
+        )
+        cached = (
+            password,
+            "<div class='passgen-strength'>"
+            f"<h4 style='color:{color} !important;margin:0'>{_STRENGTH_EMOJI[level]} {label}</h4>"
+            f"<div class='passgen-bar'><div style='width:{score}%;background:{color}'></div></div>"
+            "</div>"
+            f"<div class='passgen-metrics'>{metrics}</div>",
+        )
+        st.session_state["_strength_html"] = cached
 
-    m1, m2, m3, m4 = st.columns(4)
-    m1.metric("Length",      len(password))
-    m2.metric("Entropy",     f"{ent} bits")
-    m3.metric("Charset",     cs)
-    m4.metric("Crack Time",  ct)
+    st.markdown(cached[1], unsafe_allow_html=True)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Download helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+_GENERATOR_TAG = "PassGen v2.0 – github.com/Baset98/password-generator"
+
+# Fixed-schema fallback used when orjson is missing; matches
+# json.dumps(payload, indent=2, ensure_ascii=False) byte for byte.
+_JSON_TEMPLATE = """{{
+  "password": {password},
+  "type": {type},
+  "strength": {{
+    "score": {score},
+    "label": {label}
+  }},
+  "length": {length},
+  "charset_size": {charset_size},
+  "entropy_bits": {entropy_bits},
+  "crack_time": {crack_time},
+  "generated_at": {generated_at},
+  "generator": {generator}
+}}"""
+
+
+def _json_str(value: str) -> str:
+    """Return *value* as a quoted, escaped JSON string literal."""
+    return json.dumps(value, ensure_ascii=False)
+
+
 def _build_json_payload(password: str, pw_type: str) -> str:
-    score, label = PasswordGenerator.compute_strength(password)
-    cs           = PasswordGenerator.charset_size(password)
-    ent          = PasswordGenerator.entropy_bits(password)
-    ct           = PasswordGenerator.crack_time_label(password)
-    return json.dumps(
-        {
+    """
+    Return the JSON export for *password*.
+
+    The result is kept in session state and only rebuilt when the password
+    or its type changes, so reruns from unrelated widgets skip serialisation.
+    """
+    cached = st.session_state.get("_json_payload")
+    if cached is not None and cached[0] == (password, pw_type):
+        return cached[1]
+
+    score, label, _, length, cs, ent, ct = _password_stats(password)
+    generated_at = (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
+    if orjson is not None:
+        payload = {
             "password":     password,
             "type":         pw_type,
             "strength":     {"score": score, "label": label},
-            "length":       len(password),
+            "length":       length,
             "charset_size": cs,
             "entropy_bits": ent,
             "crack_time":   ct,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "generator":    "PassGen v2.0 – github.com/Baset98/password-generator",
-        },
-        indent=2,
-        ensure_ascii=False,
-    )
+            "generated_at": generated_at,
+            "generator":    _GENERATOR_TAG,
+        }
+        json_str = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    else:
+        json_str = _JSON_TEMPLATE.format_map({
+            "password":     _json_str(password),
+            "type":         _json_str(pw_type),
+            "score":        score,
+            "label":        _json_str(label),
+            "length":       length,
+            "charset_size": cs,
+            "entropy_bits": ent,
+            "crack_time":   _json_str(ct),
+            "generated_at": _json_str(generated_at),
+            "generator":    _json_str(_GENERATOR_TAG),
+        })
+
+    st.session_state["_json_payload"] = ((password, pw_type), json_str)
+    return json_str
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# ── Header ──
+# History helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-try:
-    st.image("./images/banner.jpeg", use_container_width=True)
-except Exception:
-    pass  # Banner image optional
+def _history_row(password: str) -> str:
+    """Return one ``<tr>`` of the history table: password + strength badge."""
+    stats = _password_stats(password)
+    return (
+        f"<tr><td><code class='passgen-code'>{html.escape(password)}</code></td>"
+        f"<td style='color:{_STRENGTH_COLORS[stats.level]}'>"
+        f"{_STRENGTH_EMOJI[stats.level]} {stats.label}</td></tr>"
+    )
 
-st.title("🔐 PassGen — Password Generator")
-st.caption(
-    "Military-grade passwords, generated locally. "
-    "Zero storage · Zero tracking · 100% private."
-)
-st.write("---")
 
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 1 · Password Type Selector ──
-# ─────────────────────────────────────────────────────────────────────────────
+def _clear_history() -> None:
+    st.session_state.history = deque(maxlen=_HISTORY_LIMIT)
+    st.session_state._history_html = ""
+    st.session_state._stats = {}
 
-st.subheader("① Select Password Type")
 
-pw_type = st.radio(
-    "Password Type",
-    options=["🎲 Random Password", "🧠 Memorable Password", "🔢 PIN Code"],
-    horizontal=True,
-    label_visibility="collapsed",
-)
+def _record_password(password: str) -> None:
+    """Make *password* the current one and add it to the session history."""
+    _record_passwords([password])
 
-# Reset password when type changes
-if st.session_state.last_type != pw_type:
-    st.session_state.password  = None
-    st.session_state.generator = None
-    st.session_state.last_type = pw_type
 
-# ── Guide: type selector ──
-with st.expander("📚 Guide: Which password type should I choose?"):
-    st.markdown("""
+def _record_passwords(passwords: list[str]) -> None:
+    """
+    Add *passwords* (oldest first) to the history; the last becomes current.
+
+    Only the new rows are rendered; they are prepended to the cached table
+    body, which is then trimmed back to ``_HISTORY_LIMIT`` rows.
+    """
+    st.session_state.password = passwords[-1]
+    st.session_state.history.extend(passwords)
+    new_rows = "".join(_history_row(pw) for pw in reversed(passwords))
+    rows = new_rows + st.session_state._history_html
+    parts = rows.split("</tr>", _HISTORY_LIMIT)
+    if len(parts) > _HISTORY_LIMIT:
+        rows = "</tr>".join(parts[:_HISTORY_LIMIT]) + "</tr>"
+    st.session_state._history_html = rows
+
+    # Drop stats for passwords that have fallen out of the history
+    live  = set(st.session_state.history)
+    stats = st.session_state._stats
+    for stale in [k for k in stats if k not in live]:
+        del stats[stale]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Inline guides
+# ─────────────────────────────────────────────────────────────────────────────
+
+_GUIDES: dict[str, tuple[str, str]] = {
+    "type": (
+        "📚 Guide: Which password type should I choose?",
+        """
 ### 🎯 Choosing the right type
 
 Each password type is designed for a different use case:
@@ -330,87 +356,11 @@ Each password type is designed for a different use case:
 ---
 
 > ⚠️ **Never reuse passwords across accounts.** A single breach can compromise everything.
-    """)
-
-st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 2 · Configuration ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-st.subheader("② Configure Options")
-
-_type_key = pw_type.split()[1].lower()  # "random" | "memorable" | "pin"
-
-if _type_key == "random":
-    # ── Random ────────────────────────────────────────────────
-    length = st.slider("Password Length", min_value=5, max_value=64, value=16)
-
-    st.write("**Character Types**")
-    c1, c2 = st.columns(2)
-    with c1:
-        inc_upper  = st.checkbox("Uppercase  (A–Z)", value=True,  key="r_upper")
-        inc_digits = st.checkbox("Numbers   (0–9)", value=True,  key="r_digits")
-    with c2:
-        inc_lower  = st.checkbox("Lowercase  (a–z)", value=True,  key="r_lower")
-        inc_symbols = st.checkbox("Symbols   (!@#$)", value=False, key="r_symbols")
-
-    exc_similar = st.checkbox(
-        "Exclude similar-looking characters  (O, 0, l, I, 1)",
-        value=False, key="r_exc_sim",
-    )
-    no_repeat = st.toggle("No Repeated Characters", value=False, key="r_no_rep")
-    use_crypto = st.toggle(
-        "Cryptographically Secure  (crypto.secrets)",
-        value=True, key="r_crypto",
-        help="Uses Python's `secrets` module backed by the OS entropy pool.",
-    )
-
-    if not (inc_upper or inc_lower or inc_digits or inc_symbols):
-        st.warning("⚠️ Please select at least one character type.")
-        st.session_state.generator = None
-    else:
-        st.session_state.generator = RandomPasswordGenerator(
-            length=length,
-            include_uppercase=inc_upper,
-            include_lowercase=inc_lower,
-            include_digits=inc_digits,
-            include_symbols=inc_symbols,
-            exclude_similar=exc_similar,
-            no_repeated_characters=no_repeat,
-            use_secrets=use_crypto,
-        )
-
-elif _type_key == "memorable":
-    # ── Memorable ─────────────────────────────────────────────
-    no_of_words = st.slider("Number of Words", min_value=2, max_value=8, value=4)
-    c1, c2 = st.columns(2)
-    with c1:
-        separator  = st.text_input("Separator", value="-", max_chars=3, key="m_sep")
-        capitalize = st.checkbox("Capitalize Words", value=True, key="m_cap")
-    with c2:
-        suffix_len = st.number_input("Numeric Suffix Length", min_value=0, max_value=6, value=2, key="m_suf")
-
-    word_list = load_word_list()
-    st.session_state.generator = MemorablePasswordGenerator(
-        no_of_words=no_of_words,
-        separator=separator or "-",
-        capitalization=capitalize,
-        vocabulary=word_list,
-        suffix_length=int(suffix_len),
-    )
-
-else:
-    # ── PIN ───────────────────────────────────────────────────
-    pin_length    = st.slider("PIN Length", min_value=4, max_value=12, value=6)
-    avoid_seq     = st.checkbox("Avoid Sequential Digits  (e.g. 1234, 0000)", value=False, key="p_seq")
-    st.session_state.generator = PinCodeGenerator(
-        length=pin_length, avoid_sequential=avoid_seq
-    )
-
-# ── Guide: configuration ──
-with st.expander("⚙️ Guide: Configuration options explained"):
-    st.markdown("""
+""",
+    ),
+    "config": (
+        "⚙️ Guide: Configuration options explained",
+        """
 ### 📏 Password Length
 
 The single most impactful factor in password security.
@@ -454,54 +404,11 @@ Requires: **charset size ≥ password length**.
 Python's `secrets` module reads from the OS entropy pool (`/dev/urandom` on Linux/macOS,
 `CryptGenRandom` on Windows) — the same source used by TLS, SSH key generation, and
 token minting. **Always keep this on** unless you have a specific reason not to.
-    """)
-
-st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 3 · Generate ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-st.subheader("③ Generate Your Password")
-
-# Auto-generate on first load
-if st.session_state.password is None and st.session_state.generator is not None:
-    try:
-        st.session_state.password = st.session_state.generator.generate()
-        st.session_state.history.append(st.session_state.password)
-    except ValueError:
-        pass
-
-# Generate button
-if st.button("⚡ Generate New Password", type="primary", use_container_width=True):
-    if st.session_state.generator is None:
-        st.error("❌ Please fix the configuration above before generating.")
-    else:
-        try:
-            pw = st.session_state.generator.generate()
-            st.session_state.password = pw
-            st.session_state.history.append(pw)
-            st.rerun()
-        except ValueError as exc:
-            st.error(f"❌ {exc}")
-
-st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 4 · Password Display & Strength ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-if st.session_state.password:
-    pw = st.session_state.password
-
-    st.subheader("④ Your Password")
-    st.code(pw, language=None)
-
-    _render_strength(pw)
-
-    # ── Guide: strength stats ──
-    with st.expander("📊 Guide: How to read the security stats"):
-        st.markdown("""
+""",
+    ),
+    "stats": (
+        "📊 Guide: How to read the security stats",
+        """
 ### 📏 Length
 Total number of characters. Every extra character raises security **exponentially**.
 
@@ -539,48 +446,11 @@ Real attacks are often slower; this is the worst case.
 | Medium | 40–59 | 🟠 Orange |
 | Strong | 60–79 | 🟡 Yellow |
 | Very Strong | 80–100 | 🟢 Green |
-        """)
-
-    st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 5 · Download ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-st.subheader("⑤ Download Your Password")
-
-with st.expander("⬇️ Export Options", expanded=bool(st.session_state.password)):
-    if st.session_state.password:
-        pw       = st.session_state.password
-        pw_label = pw_type.replace("🎲 ", "").replace("🧠 ", "").replace("🔢 ", "")
-        json_str = _build_json_payload(pw, pw_label)
-
-        d1, d2 = st.columns(2)
-        with d1:
-            st.download_button(
-                label="📄 Download as TXT",
-                data=pw,
-                file_name="password.txt",
-                mime="text/plain",
-                use_container_width=True,
-                key="dl_txt",
-            )
-        with d2:
-            st.download_button(
-                label="📦 Download as JSON",
-                data=json_str,
-                file_name="password.json",
-                mime="application/json",
-                use_container_width=True,
-                key="dl_json",
-            )
-
-    else:
-        st.info("Generate a password first to enable downloads.")
-
-    # ── Guide: export formats ──
-    with st.expander("💾 Guide: Export formats explained"):
-        st.markdown("""
+""",
+    ),
+    "export": (
+        "💾 Guide: Export formats explained",
+        """
 ### 📄 TXT Format
 A plain text file containing **only the password**.
 
@@ -607,44 +477,11 @@ A structured file with **full metadata**:
 **Best for:** Audit logs, developer tooling, batch credential management.
 
 > ⚠️ Delete the file after importing it into your Password Manager.
-        """)
-
-st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 6 · Session History ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-st.subheader("⑥ Session History")
-
-with st.expander(
-    f"🕑 History  ({len(st.session_state.history)} passwords this session)",
-    expanded=False,
-):
-    if not st.session_state.history:
-        st.info("No passwords generated yet in this session.")
-    else:
-        # Show in reverse chronological order; newest first
-        for idx, item in enumerate(reversed(st.session_state.history[-30:]), start=1):
-            sc, lbl = PasswordGenerator.compute_strength(item)
-            emoji   = _STRENGTH_EMOJI.get(lbl, "⚪")
-            col_pw, col_badge = st.columns([5, 1])
-            with col_pw:
-                st.code(item, language=None)
-            with col_badge:
-                st.markdown(
-                    f"<span style='font-size:0.75rem;color:{_STRENGTH_COLORS[lbl]}'>"
-                    f"{emoji} {lbl}</span>",
-                    unsafe_allow_html=True,
-                )
-
-        if st.button("🗑️ Clear History", key="clear_hist"):
-            st.session_state.history = []
-            st.rerun()
-
-    # ── Guide: history & privacy ──
-    with st.expander("🔒 Guide: Session History & Your Privacy"):
-        st.markdown("""
+""",
+    ),
+    "privacy": (
+        "🔒 Guide: Session History & Your Privacy",
+        """
 ### 📝 Session History
 Tracks up to **30 recently generated passwords** in Streamlit's session state.
 
@@ -674,16 +511,11 @@ Tracks up to **30 recently generated passwords** in Streamlit's session state.
 - Enable **2FA / MFA** on all important accounts.
 - Use a **unique password** for every single account.
 - Avoid entering passwords on public computers or unsecured networks.
-        """)
-
-st.write("---")
-
-# ─────────────────────────────────────────────────────────────────────────────
-# ── Section 7 · Full Security Guide ──
-# ─────────────────────────────────────────────────────────────────────────────
-
-with st.expander("📖 Full Security Guide: Password Types, Privacy & Best Practices"):
-    st.markdown("""
+""",
+    ),
+    "security": (
+        "📖 Full Security Guide: Password Types, Privacy & Best Practices",
+        """
 ### 🛡️ Why Does Password Security Matter?
 
 Using weak or reused passwords (like `123456` or `password`) is the **#1 cause** of account
@@ -747,7 +579,312 @@ Your Browser / Python Runtime
 
 > 🔑 A password manager + unique passwords for every site is the single most
 > impactful security improvement most people can make.
-    """)
+""",
+    ),
+}
+
+
+def _toggle_guide(name: str) -> None:
+    st.session_state[f"exp_{name}_open"] = not st.session_state.get(f"exp_{name}_open", False)
+
+
+def _render_guide(name: str) -> None:
+    """
+    Render a collapsible guide whose body is only sent while it is open.
+
+    Unlike ``st.expander``, a closed guide emits nothing but its header
+    button, so the large Markdown bodies are not shipped and parsed on every
+    rerun.  It can also be placed inside an ``st.expander``.
+    """
+    title, body = _GUIDES[name]
+    is_open = st.session_state.get(f"exp_{name}_open", False)
+    st.button(
+        f"{'▾' if is_open else '▸'}  {title}",
+        key=f"guide_{name}",
+        type="tertiary",
+        on_click=_toggle_guide,
+        args=(name,),
+    )
+    if is_open:
+        with st.container(border=True):
+            st.markdown(body)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Configuration builders  (one per password type)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _build_random_gen() -> Optional[PasswordGenerator]:
+    """Render the random-password options and return the configured generator."""
+    length = st.slider("Password Length", min_value=5, max_value=64, value=16)
+
+    st.write("**Character Types**")
+    c1, c2 = st.columns(2)
+    with c1:
+        inc_upper  = st.checkbox("Uppercase  (A–Z)", value=True,  key="r_upper")
+        inc_digits = st.checkbox("Numbers   (0–9)", value=True,  key="r_digits")
+    with c2:
+        inc_lower  = st.checkbox("Lowercase  (a–z)", value=True,  key="r_lower")
+        inc_symbols = st.checkbox("Symbols   (!@#$)", value=False, key="r_symbols")
+
+    exc_similar = st.checkbox(
+        "Exclude similar-looking characters  (O, 0, l, I, 1)",
+        value=False, key="r_exc_sim",
+    )
+    no_repeat = st.toggle("No Repeated Characters", value=False, key="r_no_rep")
+    use_crypto = st.toggle(
+        "Cryptographically Secure  (crypto.secrets)",
+        value=True, key="r_crypto",
+        help="Uses Python's `secrets` module backed by the OS entropy pool.",
+    )
+
+    mask = (
+        inc_upper * CHARSET_UPPER
+        | inc_lower * CHARSET_LOWER
+        | inc_digits * CHARSET_DIGITS
+        | inc_symbols * CHARSET_SYMBOLS
+    )
+    if not mask:
+        st.warning("⚠️ Please select at least one character type.")
+        return None
+    return get_random_generator(
+        length=length,
+        exclude_similar=exc_similar,
+        no_repeated_characters=no_repeat,
+        use_secrets=use_crypto,
+        charset_flags=mask,
+    )
+
+
+def _build_memorable_gen() -> Optional[PasswordGenerator]:
+    """Render the memorable-password options and return the configured generator."""
+    no_of_words = st.slider("Number of Words", min_value=2, max_value=8, value=4)
+    c1, c2 = st.columns(2)
+    with c1:
+        separator  = st.text_input("Separator", value="-", max_chars=3, key="m_sep")
+        capitalize = st.checkbox("Capitalize Words", value=True, key="m_cap")
+    with c2:
+        suffix_len = st.number_input("Numeric Suffix Length", min_value=0, max_value=6, value=2, key="m_suf")
+
+    load_word_list()   # warm the shared corpus behind a spinner
+    return get_memorable_generator(
+        no_of_words=no_of_words,
+        separator=separator or "-",
+        capitalization=capitalize,
+        suffix_length=int(suffix_len),
+    )
+
+
+def _build_pin_gen() -> Optional[PasswordGenerator]:
+    """Render the PIN options and return the configured generator."""
+    pin_length    = st.slider("PIN Length", min_value=4, max_value=12, value=6)
+    avoid_seq     = st.checkbox("Avoid Sequential Digits  (e.g. 1234, 0000)", value=False, key="p_seq")
+    return get_pin_generator(length=pin_length, avoid_sequential=avoid_seq)
+
+
+_TYPE_MAP = {
+    "🎲 Random Password":    "random",
+    "🧠 Memorable Password": "memorable",
+    "🔢 PIN Code":           "pin",
+}
+
+_GENERATOR_BUILDERS: dict[str, Callable[[], Optional[PasswordGenerator]]] = {
+    "random":    _build_random_gen,
+    "memorable": _build_memorable_gen,
+    "pin":       _build_pin_gen,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Header ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+@st.cache_resource(show_spinner=False)
+def _banner_bytes() -> bytes:
+    """Read the banner JPEG once per process instead of on every rerun."""
+    return Path("./images/banner.jpeg").read_bytes()
+
+
+try:
+    st.image(_banner_bytes(), use_container_width=True)
+except Exception:
+    pass  # Banner image optional
+
+st.title("🔐 PassGen — Password Generator")
+st.caption(
+    "Military-grade passwords, generated locally. "
+    "Zero storage · Zero tracking · 100% private."
+)
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 1 · Password Type Selector ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+st.subheader("① Select Password Type")
+
+pw_type = st.radio(
+    "Password Type",
+    options=list(_TYPE_MAP),
+    horizontal=True,
+    label_visibility="collapsed",
+)
+
+# Reset password when type changes
+if st.session_state.last_type != pw_type:
+    st.session_state.password  = None
+    st.session_state.generator = None
+    st.session_state.last_type = pw_type
+
+# ── Guide: type selector ──
+_render_guide("type")
+
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 2 · Configuration ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+st.subheader("② Configure Options")
+
+st.session_state.generator = _GENERATOR_BUILDERS[_TYPE_MAP[pw_type]]()
+
+# ── Guide: configuration ──
+_render_guide("config")
+
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 3 · Generate ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+st.subheader("③ Generate Your Password")
+
+# Auto-generate on first load
+if st.session_state.password is None and st.session_state.generator is not None:
+    try:
+        _record_password(st.session_state.generator.generate())
+    except ValueError:
+        pass
+
+# Generate buttons
+col_one, col_batch = st.columns([3, 1])
+with col_one:
+    gen_one = st.button("⚡ Generate New Password", type="primary", use_container_width=True)
+with col_batch:
+    gen_batch = st.button(
+        f"⚡ Generate {_BATCH_SIZE}", use_container_width=True,
+        help=f"Generate {_BATCH_SIZE} passwords at once and add them all to the history.",
+    )
+
+if gen_one or gen_batch:
+    if st.session_state.generator is None:
+        st.error("❌ Please fix the configuration above before generating.")
+    else:
+        try:
+            # No st.rerun(): the click already triggered this run and the
+            # sections below read the updated session state.
+            _record_passwords(
+                st.session_state.generator.generate_batch(_BATCH_SIZE if gen_batch else 1)
+            )
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 4 · Password Display & Strength ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+if st.session_state.password:
+    pw = st.session_state.password
+
+    st.subheader("④ Your Password")
+    st.code(pw, language=None)
+
+    _render_strength(pw)
+
+    # ── Guide: strength stats ──
+    _render_guide("stats")
+
+    st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 5 · Download ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+st.subheader("⑤ Download Your Password")
+
+with st.expander("⬇️ Export Options", expanded=bool(st.session_state.password)):
+    if st.session_state.password:
+        pw       = st.session_state.password
+        pw_label = pw_type.replace("🎲 ", "").replace("🧠 ", "").replace("🔢 ", "")
+        json_str = _build_json_payload(pw, pw_label)
+
+        d1, d2 = st.columns(2)
+        with d1:
+            st.download_button(
+                label="📄 Download as TXT",
+                data=pw,
+                file_name="password.txt",
+                mime="text/plain",
+                use_container_width=True,
+                key="dl_txt",
+            )
+        with d2:
+            st.download_button(
+                label="📦 Download as JSON",
+                data=json_str,
+                file_name="password.json",
+                mime="application/json",
+                use_container_width=True,
+                key="dl_json",
+            )
+
+    else:
+        st.info("Generate a password first to enable downloads.")
+
+    # ── Guide: export formats ──
+    _render_guide("export")
+
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 6 · Session History ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+st.subheader("⑥ Session History")
+
+with st.expander(
+    f"🕑 History  ({len(st.session_state.history)} passwords this session)",
+    expanded=False,
+):
+    if not st.session_state.history:
+        st.info("No passwords generated yet in this session.")
+    else:
+        # Rows are kept pre-rendered, newest first; rebuild only if they went missing
+        if not st.session_state._history_html:
+            st.session_state._history_html = "".join(
+                _history_row(item) for item in reversed(st.session_state.history)
+            )
+        st.markdown(
+            f"<table class='passgen-history'>{st.session_state._history_html}</table>",
+            unsafe_allow_html=True,
+        )
+
+        # Cleared in a callback so the table above is already empty on this run
+        st.button("🗑️ Clear History", key="clear_hist", on_click=_clear_history)
+
+    # ── Guide: history & privacy ──
+    _render_guide("privacy")
+
+st.write("---")
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ── Section 7 · Full Security Guide ──
+# ─────────────────────────────────────────────────────────────────────────────
+
+_render_guide("security")
 
 # ─────────────────────────────────────────────────────────────────────────────
 # ── Footer ──
@@ -8,15 +8,28 @@ Classes:
     RandomPasswordGenerator   – Cryptographically-random string passwords
     MemorablePasswordGenerator– XKCD-style word-phrase passwords
     PinCodeGenerator          – Numeric PIN codes
+
+Factories (memoised – identical arguments return the same instance):
+    get_random_generator, get_memorable_generator, get_pin_generator
+
+Note: the strength/entropy/crack-time helpers memoise their results, so the
+most recent 32 scored passwords are retained in process memory.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import math
+import os
 import random
 import secrets
 import string
+import struct
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from pathlib import Path
+from typing import NamedTuple, Optional, Sequence
 
 import nltk
 
@@ -25,15 +38,349 @@ import nltk
 # NLTK bootstrap
 # ─────────────────────────────────────────────────────────────────────────────
 
+_NLTK_READY: bool = False
+
+
 def _ensure_nltk_words() -> None:
-    """Download the NLTK 'words' corpus if it is not already present."""
+    """Download the NLTK 'words' corpus if it is not already present.
+
+    Called only when the vocabulary has to be built from the corpus; once
+    the corpus is known to be available, later calls return immediately.
+    A failed download is retried on the next call.
+    """
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
     try:
         nltk.data.find("corpora/words")
+        _NLTK_READY = True
     except LookupError:
-        nltk.download("words", quiet=True)
+        _NLTK_READY = bool(nltk.download("words", quiet=True))
+
+
+def _vocab_cache_path(min_len: int, max_len: int) -> Path:
+    """
+    Location of the on-disk filtered vocabulary for one length window.
+
+    Raises RuntimeError when ``XDG_CACHE_HOME`` is unset and the home
+    directory cannot be determined.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "passgen" / f"vocab_{min_len}_{max_len}_nltk{nltk.__version__}.txt"
+
+
+_VOCAB_MAGIC: str = "passgen-vocab-v1"
+
+# A cached list shorter than this is never trusted, so a truncated or swapped
+# file cannot silently shrink the passphrase space to a handful of words.
+_VOCAB_MIN_WORDS: int = 1_000
+
+
+def _keep_word(word: str, min_len: int, max_len: int) -> bool:
+    """The vocabulary filter: simple lowercase words within the length window."""
+    # islower() first – it rejects the title-cased entries that dominate the corpus
+    return min_len <= len(word) <= max_len and word.islower() and word.isalpha()
+
+
+def _read_vocab_cache(path: Path, min_len: int, max_len: int) -> Optional[list[str]]:
+    """
+    Return the words stored at *path*, or None if the file is missing or
+    fails validation.
+
+    The header's word count and SHA-256 only detect accidental corruption
+    (e.g. a truncated write) – anyone who can write the file can also write
+    a matching header.  Beyond that, every word must pass the filter and the
+    list must hold at least ``_VOCAB_MIN_WORDS`` entries; a deliberately
+    crafted file that meets those checks is trusted.
+    """
+    try:
+        header, _, body = path.read_text(encoding="utf-8").partition("\n")
+        magic, count, digest = header.split()
+        words = body.split("\n")
+        if (
+            magic != _VOCAB_MAGIC
+            or int(count) != len(words)
+            or len(words) < _VOCAB_MIN_WORDS
+            or hashlib.sha256(body.encode("utf-8")).hexdigest() != digest
+            or not all(_keep_word(w, min_len, max_len) for w in words)
+        ):
+            return None
+        return words
+    except (OSError, ValueError):   # UnicodeDecodeError is a ValueError
+        return None
+
+
+def _write_vocab_cache(path: Path, words: list[str]) -> None:
+    """Atomically write *words* to *path*; failures are silently ignored."""
+    body = "\n".join(words)
+    header = f"{_VOCAB_MAGIC} {len(words)} {hashlib.sha256(body.encode('utf-8')).hexdigest()}"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer, so concurrent threads never share a temp file
+        tmp = path.with_suffix(f".{os.getpid()}.{secrets.token_hex(4)}.tmp")
+        try:
+            tmp.write_text(f"{header}\n{body}", encoding="utf-8")
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _load_or_build_vocab(min_len: int, max_len: int) -> list[str]:
+    """
+    Return the filtered vocabulary, reading it from the disk cache when valid.
+
+    On a miss the NLTK corpus is filtered and the result written back, so
+    later interpreter starts neither load nor download the corpus.  The file
+    name includes the NLTK version, which invalidates the cache on upgrade; a
+    missing, corrupt or undersized file falls back to rebuilding from NLTK,
+    and without a usable cache location the disk cache is skipped entirely.
+    """
+    try:
+        path: Optional[Path] = _vocab_cache_path(min_len, max_len)
+    except RuntimeError:            # no XDG_CACHE_HOME and no home directory
+        path = None
+
+    if path is not None:
+        words = _read_vocab_cache(path, min_len, max_len)
+        if words:
+            return words
 
+    _ensure_nltk_words()
+    raw = nltk.corpus.words.words()
+    words = [w for w in raw if _keep_word(w, min_len, max_len)]
 
-_ensure_nltk_words()
+    if path is not None and len(words) >= _VOCAB_MIN_WORDS:
+        _write_vocab_cache(path, words)
+    return words
+
+
+class _Vocabulary(NamedTuple):
+    """A filtered word list in both the spellings a generator may need."""
+    lower: tuple[str, ...]
+    cap:   tuple[str, ...]
+    size:  int
+
+
+@functools.lru_cache(maxsize=None)
+def _get_filtered_words(min_len: int, max_len: int) -> _Vocabulary:
+    """
+    Return the NLTK 'words' corpus filtered to simple lowercase words whose
+    length lies in ``[min_len, max_len]``, plus the same words capitalised.
+
+    The corpus is read and filtered once per length window per process; every
+    generator built afterwards shares the same (interned) tuples.
+    """
+    lower = tuple(sys.intern(w) for w in _load_or_build_vocab(min_len, max_len))
+    return _Vocabulary(
+        lower=lower,
+        cap=tuple(sys.intern(w.capitalize()) for w in lower),
+        size=len(lower),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Character-class bit flags  (see RandomPasswordGenerator.charset_flags)
+# ─────────────────────────────────────────────────────────────────────────────
+
+CHARSET_UPPER:   int = 1 << 0
+CHARSET_LOWER:   int = 1 << 1
+CHARSET_DIGITS:  int = 1 << 2
+CHARSET_SYMBOLS: int = 1 << 3
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Strength analysis kernels  (shared by the PasswordGenerator metrics)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _char_class(c: str) -> int:
+    """Return the ``CHARSET_*`` bits that the single character *c* belongs to."""
+    return (
+        (CHARSET_UPPER   if c.isupper()     else 0)
+        | (CHARSET_LOWER   if c.islower()     else 0)
+        | (CHARSET_DIGITS  if c.isdigit()     else 0)
+        | (CHARSET_SYMBOLS if not c.isalnum() else 0)
+    )
+
+
+# byte → class bits for ASCII; padded to 256 entries for bytes.translate()
+_CLASS_LUT: bytes = bytes(_char_class(chr(i)) for i in range(128)) + bytes(128)
+
+
+def _class_mask(password: str) -> int:
+    """
+    Return the OR of the ``CHARSET_*`` bits of every character in *password*.
+
+    ASCII input is classified in a single C-level ``bytes.translate`` pass;
+    anything else falls back to classifying each distinct character.
+    """
+    mask = 0
+    if password.isascii():
+        for bits in set(password.encode("ascii").translate(_CLASS_LUT)):
+            mask |= bits
+    else:
+        for c in set(password):
+            mask |= _char_class(c)
+    return mask
+
+
+def _mask_and_len(password: str) -> tuple[int, int]:
+    """Return ``(class_mask, length)`` for *password*."""
+    return _class_mask(password), len(password)
+
+
+# Alphabet size implied by each of the 16 possible class masks (10 if empty),
+# and its log₂ – so the metrics below never recompute either.
+_CHARSET_BY_MASK: tuple[int, ...] = tuple(
+    (
+        (26 if m & CHARSET_UPPER   else 0)
+        + (26 if m & CHARSET_LOWER   else 0)
+        + (10 if m & CHARSET_DIGITS  else 0)
+        + (32 if m & CHARSET_SYMBOLS else 0)
+    ) or 10
+    for m in range(16)
+)
+_LOG2 = math.log2
+_LOG2_CHARSET: tuple[float, ...] = tuple(_LOG2(cs) for cs in _CHARSET_BY_MASK)
+
+# The analysis caches below are keyed by the plaintext password, so they are
+# kept tiny: enough for the UI asking several metrics of the same string,
+# without retaining a long tail of scored passwords in process memory.
+_ANALYSIS_CACHE_SIZE: int = 32
+
+# Brute-force model: 10¹⁰ guesses/second; anything past 3·10¹² s is "∞"
+_LOG2_GUESSES_PER_SEC: float = _LOG2(1e10)
+_LOG2_UNCRACKABLE_SECS: float = _LOG2(3e12)
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _analyze(password: str) -> tuple[int, int, int, float]:
+    """
+    Return ``(length, charset_size, entropy_bits, log2_crack_seconds)`` for
+    *password* from a single classification pass.
+
+    Crack time stays in the log domain (``log₂(cs**length / 1e10)``), so long
+    passwords never materialise a huge ``cs ** length`` integer.
+    """
+    mask, length = _mask_and_len(password)
+    cs = _CHARSET_BY_MASK[mask]
+    log2_space = length * _LOG2_CHARSET[mask]
+    return length, cs, int(log2_space), log2_space - _LOG2_GUESSES_PER_SEC
+
+
+def _score_kernel(length: int, mask: int) -> tuple[int, str]:
+    """Score a password from its length and class mask (see ``compute_strength``)."""
+    has_digit  = mask & CHARSET_DIGITS
+    has_symbol = mask & CHARSET_SYMBOLS
+
+    # Length contribution (capped at 40 pts)
+    length_score = min(max(length - 4, 0) / 24 * 40, 40)
+
+    # Diversity contribution (each class = 10 pts, max 40)
+    diversity_score = bin(mask).count("1") / 4 * 40
+
+    # Complexity bonus
+    if has_digit and has_symbol:
+        bonus = 20
+    elif has_digit or has_symbol:
+        bonus = 10
+    else:
+        bonus = 0
+
+    score = int(min(100, round(length_score + diversity_score + bonus)))
+
+    if score < 40:
+        label = "Weak"
+    elif score < 60:
+        label = "Medium"
+    elif score < 80:
+        label = "Strong"
+    else:
+        label = "Very Strong"
+
+    return score, label
+
+
+# The score depends only on the class mask and the length, and the length
+# term saturates at 28 characters – so every possible result fits in a
+# 29 × 16 table built once at import.
+_STRENGTH_LENGTH_CAP: int = 28
+_STRENGTH_TABLE: tuple[tuple[tuple[int, str], ...], ...] = tuple(
+    tuple(_score_kernel(length, mask) for mask in range(16))
+    for length in range(_STRENGTH_LENGTH_CAP + 1)
+)
+
+
+# The metrics are pure functions of the password and the UI asks for all of
+# them on the same string, so the static methods below forward to these
+# memoised implementations (``_analyze`` above is cached the same way).
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _compute_strength_impl(password: str) -> tuple[int, str]:
+    if not password:
+        return 0, "Weak"
+    mask, length = _mask_and_len(password)
+    return _STRENGTH_TABLE[min(length, _STRENGTH_LENGTH_CAP)][mask]
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _crack_time_label_impl(password: str) -> str:
+    length, cs, _, log2_secs = _analyze(password)
+    # Small tolerance so float rounding never skips the exact check below
+    if log2_secs > _LOG2_UNCRACKABLE_SECS + 1e-6:
+        return "∞ (practically uncrackable)"
+    # Below the cap cs ** length is at most ~3·10²², so the exact value is cheap
+    secs = (cs ** length) / 1e10
+    if secs < 1:       return "< 1 second"
+    if secs < 60:      return f"{int(secs)} seconds"
+    if secs < 3_600:   return f"{int(secs/60)} minutes"
+    if secs < 86_400:  return f"{int(secs/3_600)} hours"
+    if secs < 3e7:     return f"{int(secs/86_400)} days"
+    if secs < 3e9:     return f"{int(secs/3e7)} years"
+    if secs < 3e12:    return f"{int(secs/3e9):,} thousand years"
+    return "∞ (practically uncrackable)"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Bounded random integers
+# ─────────────────────────────────────────────────────────────────────────────
+
+_U64_MASK: int = (1 << 64) - 1
+
+
+def _bounded_indices(ranges: Sequence[int]) -> list[int]:
+    """
+    Return one uniform index in ``range(r)`` for every ``r`` in *ranges*.
+
+    Uses Lemire's multiply-and-shift method: a 64-bit word ``x`` maps to
+    ``(x * r) >> 64``, and only the rare words whose low half falls below
+    ``2**64 % r`` are redrawn.  All words come from one ``token_bytes`` call.
+    """
+    words = struct.unpack(f"<{len(ranges)}Q", secrets.token_bytes(8 * len(ranges)))
+    out = []
+    for x, r in zip(words, ranges):
+        m = x * r
+        if (m & _U64_MASK) < r:             # possible bias – check exactly
+            threshold = (1 << 64) % r
+            while (m & _U64_MASK) < threshold:
+                m = int.from_bytes(secrets.token_bytes(8), "little") * r
+        out.append(m >> 64)
+    return out
+
+
+# The same method on single bytes: digit = (b * 10) >> 8, rejecting the
+# 256 % 10 = 6 bytes whose low half would bias the result.
+_DIGIT_TABLE: bytes = bytes(0x30 + ((b * 10) >> 8) for b in range(256))
+_DIGIT_REJECT: bytes = bytes(b for b in range(256) if (b * 10) & 0xFF < 256 % 10)
+
+
+def _random_digits(n: int) -> str:
+    """Return *n* uniform random decimal digits from bulk ``token_bytes``."""
+    out = b""
+    while len(out) < n:
+        out += secrets.token_bytes(n - len(out) + 2).translate(_DIGIT_TABLE, _DIGIT_REJECT)
+    return out[:n].decode("ascii")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -43,11 +390,22 @@ _ensure_nltk_words()
 class PasswordGenerator(ABC):
     """Abstract base class that every generator must implement."""
 
+    # One OS-entropy-backed RNG shared by every generator; SystemRandom keeps
+    # no state of its own, so there is nothing to gain from one per call.
+    _SYSRAND: secrets.SystemRandom = secrets.SystemRandom()
+
     @abstractmethod
     def generate(self) -> str:
         """Return a freshly generated password string."""
         ...
 
+    def generate_batch(self, n: int) -> list[str]:
+        """Return *n* freshly generated passwords.
+
+        Subclasses may override this with a faster bulk implementation.
+        """
+        return [self.generate() for _ in range(n)]
+
     # ------------------------------------------------------------------
     # Shared utility: strength scoring
     # ------------------------------------------------------------------
@@ -70,58 +428,17 @@ class PasswordGenerator(ABC):
         60–79  Strong
         80–100 Very Strong
         """
-        if not password:
-            return 0, "Weak"
-
-        length    = len(password)
-        has_upper  = any(c.isupper()  for c in password)
-        has_lower  = any(c.islower()  for c in password)
-        has_digit  = any(c.isdigit()  for c in password)
-        has_symbol = any(not c.isalnum() for c in password)
-
-        # Length contribution (capped at 40 pts)
-        length_score = min(max(length - 4, 0) / 24 * 40, 40)
-
-        # Diversity contribution (each class = 10 pts, max 40)
-        diversity_score = sum([has_upper, has_lower, has_digit, has_symbol]) / 4 * 40
-
-        # Complexity bonus
-        if has_digit and has_symbol:
-            bonus = 20
-        elif has_digit or has_symbol:
-            bonus = 10
-        else:
-            bonus = 0
-
-        score = int(min(100, round(length_score + diversity_score + bonus)))
-
-        if score < 40:
-            label = "Weak"
-        elif score < 60:
-            label = "Medium"
-        elif score < 80:
-            label = "Strong"
-        else:
-            label = "Very Strong"
-
-        return score, label
+        return _compute_strength_impl(password)
 
     @staticmethod
     def charset_size(password: str) -> int:
         """Estimate the alphabet size used in *password*."""
-        size = 0
-        if any(c.isupper()  for c in password): size += 26
-        if any(c.islower()  for c in password): size += 26
-        if any(c.isdigit()  for c in password): size += 10
-        if any(not c.isalnum() for c in password): size += 32
-        return size or 10
+        return _analyze(password)[1]
 
     @staticmethod
     def entropy_bits(password: str) -> int:
         """Shannon entropy: H = length × log₂(charset_size)."""
-        import math
-        cs = PasswordGenerator.charset_size(password)
-        return int(len(password) * math.log2(max(cs, 2)))
+        return _analyze(password)[2]
 
     @staticmethod
     def crack_time_label(password: str) -> str:
@@ -129,17 +446,7 @@ class PasswordGenerator(ABC):
         Estimate brute-force crack time at 10¹⁰ guesses/second.
         Returns a human-readable string.
         """
-        import math
-        cs   = PasswordGenerator.charset_size(password)
-        secs = (cs ** len(password)) / 1e10
-        if secs < 1:       return "< 1 second"
-        if secs < 60:      return f"{int(secs)} seconds"
-        if secs < 3_600:   return f"{int(secs/60)} minutes"
-        if secs < 86_400:  return f"{int(secs/3_600)} hours"
-        if secs < 3e7:     return f"{int(secs/86_400)} days"
-        if secs < 3e9:     return f"{int(secs/3e7)} years"
-        if secs < 3e12:    return f"{int(secs/3e9):,} thousand years"
-        return "∞ (practically uncrackable)"
+        return _crack_time_label_impl(password)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -170,9 +477,13 @@ class RandomPasswordGenerator(PasswordGenerator):
         Use the ``secrets`` module instead of ``random`` (default True).
         The ``secrets`` module uses the OS entropy pool and is
         cryptographically secure.
+    charset_flags : int | None
+        Bitwise OR of the ``CHARSET_*`` flags.  When given it replaces the
+        four ``include_*`` booleans (default None).
     """
 
     _SIMILAR: str = "O0lI1"
+    _SIMILAR_TABLE: dict[int, Optional[int]] = str.maketrans("", "", _SIMILAR)
 
     def __init__(
         self,
@@ -184,24 +495,72 @@ class RandomPasswordGenerator(PasswordGenerator):
         exclude_similar: bool = False,
         no_repeated_characters: bool = False,
         use_secrets: bool = True,
+        charset_flags: Optional[int] = None,
     ) -> None:
         self.length = length
         self.no_repeated_characters = no_repeated_characters
         self.use_secrets = use_secrets
 
-        # Build character pool
+        if charset_flags is None:
+            charset_flags = (
+                include_uppercase * CHARSET_UPPER
+                | include_lowercase * CHARSET_LOWER
+                | include_digits * CHARSET_DIGITS
+                | include_symbols * CHARSET_SYMBOLS
+            )
+        self.charset_flags: int = charset_flags
+        self.pool: str = self._alphabet(charset_flags & 0xF, bool(exclude_similar))
+        self._pool_b: bytes = self.pool.encode("ascii")
+        self._sampler: tuple[bytes, bytes] = self._byte_sampler(self.pool)
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _alphabet(charset_flags: int, exclude_similar: bool) -> str:
+        """
+        Build the character pool for a flag combination.
+
+        There are only 16 × 2 possible inputs, so every pool is assembled
+        once per process and shared by all later instances.
+        """
         pool = ""
-        if include_uppercase: pool += string.ascii_uppercase
-        if include_lowercase: pool += string.ascii_lowercase
-        if include_digits:    pool += string.digits
-        if include_symbols:   pool += string.punctuation
+        if charset_flags & CHARSET_UPPER:   pool += string.ascii_uppercase
+        if charset_flags & CHARSET_LOWER:   pool += string.ascii_lowercase
+        if charset_flags & CHARSET_DIGITS:  pool += string.digits
+        if charset_flags & CHARSET_SYMBOLS: pool += string.punctuation
 
         if exclude_similar:
-            pool = "".join(ch for ch in pool if ch not in self._SIMILAR)
+            pool = pool.translate(RandomPasswordGenerator._SIMILAR_TABLE)
+        return pool
 
-        self.pool: str = pool
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _byte_sampler(pool: str) -> tuple[bytes, bytes]:
+        """
+        Return ``(table, reject)`` for turning random bytes into pool chars.
 
-    # ------------------------------------------------------------------
+        Each byte is masked down to the smallest power of two ≥ ``len(pool)``;
+        ``table`` maps it to ``pool[byte & mask]`` and ``reject`` lists the
+        bytes whose masked value falls outside the pool.  Because the mask
+        range divides 256, every accepted character is equally likely, and
+        ``raw.translate(table, reject)`` does the whole draw at C level.
+        """
+        n = len(pool)
+        mask = (1 << (n - 1).bit_length()) - 1 if n else 0
+        pool_b = pool.encode("ascii")
+        table = bytes(pool_b[b & mask] if (b & mask) < n else 0 for b in range(256))
+        reject = bytes(b for b in range(256) if (b & mask) >= n)
+        return table, reject
+
+    def _secure_chars(self, k: int) -> str:
+        """Draw *k* pool characters from ``secrets.token_bytes`` in bulk."""
+        table, reject = self._sampler
+        out = b""
+        while len(out) < k:
+            # Over-draw 2× – at least half of all bytes are accepted
+            out += secrets.token_bytes(2 * (k - len(out))).translate(table, reject)
+        return out[:k].decode("ascii")
 
     def generate(self) -> str:
         if not self.pool:
@@ -216,19 +575,31 @@ class RandomPasswordGenerator(PasswordGenerator):
                     f"from a pool of only {len(self.pool)}. "
                     "Reduce length or enable more character types."
                 )
-            # Fisher-Yates shuffle on a copy, then slice
-            pool_list = list(self.pool)
+            # Partial (Durstenfeld) Fisher-Yates: only the first `length`
+            # positions need to be drawn, not the whole pool.
+            pool_arr = bytearray(self._pool_b)
+            n = len(pool_arr)
+            spans = range(n, n - self.length, -1)
             if self.use_secrets:
-                # secrets.SystemRandom for shuffle
-                rng = secrets.SystemRandom()
-                rng.shuffle(pool_list)
+                offsets = _bounded_indices(spans)
             else:
-                random.shuffle(pool_list)
-            return "".join(pool_list[: self.length])
+                offsets = [random.randrange(span) for span in spans]
+            for i, offset in enumerate(offsets):
+                j = i + offset
+                pool_arr[i], pool_arr[j] = pool_arr[j], pool_arr[i]
+            return pool_arr[: self.length].decode("ascii")
 
         if self.use_secrets:
-            return "".join(secrets.choice(self.pool) for _ in range(self.length))
-        return "".join(random.choice(self.pool) for _ in range(self.length))
+            return self._secure_chars(self.length)
+        return bytes(random.choices(self._pool_b, k=self.length)).decode("ascii")
+
+    def generate_batch(self, n: int) -> list[str]:
+        # Non-crypto mode draws every character for the whole batch in one
+        # random.choices() call.  The secrets path stays per-password.
+        if self.use_secrets or self.no_repeated_characters or not self.pool:
+            return super().generate_batch(n)
+        chars = bytes(random.choices(self._pool_b, k=n * self.length)).decode("ascii")
+        return [chars[i : i + self.length] for i in range(0, n * self.length, self.length)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -248,8 +619,9 @@ class MemorablePasswordGenerator(PasswordGenerator):
         String placed between words (default ``"-"``).
     capitalization : bool
         Capitalise the first letter of each word (default True).
-    vocabulary : list[str] | None
-        Custom word list; falls back to NLTK 'words' corpus.
+    vocabulary : Sequence[str] | None
+        Custom word list (any sequence, e.g. a tuple); falls back to
+        NLTK 'words' corpus.
     suffix_length : int
         Number of random digits appended after the phrase (default 0).
     """
@@ -262,7 +634,7 @@ class MemorablePasswordGenerator(PasswordGenerator):
         no_of_words: int = 4,
         separator: str = "-",
         capitalization: bool = True,
-        vocabulary: Optional[List[str]] = None,
+        vocabulary: Optional[Sequence[str]] = None,
         suffix_length: int = 0,
     ) -> None:
         self.no_of_words   = no_of_words
@@ -270,38 +642,34 @@ class MemorablePasswordGenerator(PasswordGenerator):
         self.capitalization = capitalization
         self.suffix_length = max(0, int(suffix_length))
 
+        # ``vocabulary`` keeps the caller's spelling; ``_words`` holds the same
+        # list in its final spelling, so generate() never capitalises anything.
         if vocabulary is not None:
-            self.vocabulary = vocabulary
+            words = vocabulary if isinstance(vocabulary, tuple) else tuple(vocabulary)
+            size = len(words)
+            spelled = tuple(w.capitalize() for w in words) if capitalization else words
         else:
-            _ensure_nltk_words()
-            raw = nltk.corpus.words.words()
             # Keep only simple, common-looking words in the target length range
-            self.vocabulary = [
-                w for w in raw
-                if self._WORD_MIN_LEN <= len(w) <= self._WORD_MAX_LEN
-                and w.isalpha()
-                and w.islower()
-            ]
-
-        if len(self.vocabulary) < self.no_of_words:
+            cached = _get_filtered_words(self._WORD_MIN_LEN, self._WORD_MAX_LEN)
+            words = cached.lower
+            size = cached.size
+            spelled = cached.cap if capitalization else cached.lower
+
+        if size < self.no_of_words:
             raise ValueError(
-                f"Vocabulary too small ({len(self.vocabulary)} words) "
+                f"Vocabulary too small ({size} words) "
                 f"to pick {self.no_of_words} unique words."
             )
+        self.vocabulary: tuple[str, ...] = words
+        self._words: tuple[str, ...] = spelled
 
     # ------------------------------------------------------------------
 
     def generate(self) -> str:
-        chosen = secrets.SystemRandom().sample(self.vocabulary, self.no_of_words)
-
-        if self.capitalization:
-            chosen = [w.capitalize() for w in chosen]
-
-        phrase = self.separator.join(chosen)
+        phrase = self.separator.join(self._SYSRAND.sample(self._words, self.no_of_words))
 
         if self.suffix_length > 0:
-            suffix = "".join(str(secrets.randbelow(10)) for _ in range(self.suffix_length))
-            phrase += suffix
+            phrase += _random_digits(self.suffix_length)
 
         return phrase
 
@@ -329,30 +697,104 @@ class PinCodeGenerator(PasswordGenerator):
             raise ValueError("PIN length must be at least 1.")
         self.length = length
         self.avoid_sequential = avoid_sequential
+        self._forbidden: frozenset[str] = (
+            self._weak_pins(length) if avoid_sequential else frozenset()
+        )
 
     # ------------------------------------------------------------------
 
     def generate(self) -> str:
-        for _ in range(1_000):   # safety cap on retries
-            pin = "".join(str(secrets.randbelow(10)) for _ in range(self.length))
-            if not self.avoid_sequential or not self._is_weak(pin):
+        for _ in range(1_000):   # safety cap on retries (every 1-digit PIN is weak)
+            pin = _random_digits(self.length)
+            if pin not in self._forbidden:
                 return pin
         # Fallback – return whatever was last generated
         return pin  # type: ignore[return-value]
 
     # ------------------------------------------------------------------
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _weak_pins(length: int) -> frozenset[str]:
+        """
+        Enumerate every weak PIN of *length*: all digits identical, or a
+        run ascending / descending by one (PINs under two digits are all weak).
+
+        That is at most 28 strings (10 all-same, plus the ascending and
+        descending runs that fit in 0–9), so generate() only needs a set
+        lookup per draw.
+        """
+        digits = string.digits
+        weak = {d * length for d in digits}
+        if 2 <= length <= 10:
+            for start in range(11 - length):
+                run = digits[start:start + length]
+                weak.add(run)
+                weak.add(run[::-1])
+        return frozenset(weak)
+
     @staticmethod
     def _is_weak(pin: str) -> bool:
         """Return True if the PIN is obviously weak (sequential or all-same)."""
-        digits = [int(d) for d in pin]
-        # All identical
-        if len(set(digits)) == 1:
-            return True
-        # Strictly ascending sequential
-        if all(digits[i + 1] - digits[i] == 1 for i in range(len(digits) - 1)):
-            return True
-        # Strictly descending sequential
-        if all(digits[i] - digits[i + 1] == 1 for i in range(len(digits) - 1)):
-            return True
-        return False
+        return pin in PinCodeGenerator._weak_pins(len(pin))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Memoised factories
+# ─────────────────────────────────────────────────────────────────────────────
+# Generators hold no per-call state, so callers that rebuild one for every
+# request (e.g. a UI rerun) can share a single instance per configuration.
+
+@functools.lru_cache(maxsize=64)
+def get_random_generator(
+    length: int = 16,
+    include_uppercase: bool = True,
+    include_lowercase: bool = True,
+    include_digits: bool = True,
+    include_symbols: bool = False,
+    exclude_similar: bool = False,
+    no_repeated_characters: bool = False,
+    use_secrets: bool = True,
+    charset_flags: Optional[int] = None,
+) -> RandomPasswordGenerator:
+    """Return a shared :class:`RandomPasswordGenerator` for these arguments."""
+    return RandomPasswordGenerator(
+        length=length,
+        include_uppercase=include_uppercase,
+        include_lowercase=include_lowercase,
+        include_digits=include_digits,
+        include_symbols=include_symbols,
+        exclude_similar=exclude_similar,
+        no_repeated_characters=no_repeated_characters,
+        use_secrets=use_secrets,
+        charset_flags=charset_flags,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def get_memorable_generator(
+    no_of_words: int = 4,
+    separator: str = "-",
+    capitalization: bool = True,
+    vocabulary: Optional[tuple[str, ...]] = None,
+    suffix_length: int = 0,
+) -> MemorablePasswordGenerator:
+    """
+    Return a shared :class:`MemorablePasswordGenerator` for these arguments.
+
+    *vocabulary* must be hashable (``None`` or a tuple).  A large tuple is
+    re-hashed on every call, so prefer ``None`` for the built-in corpus.
+    """
+    return MemorablePasswordGenerator(
+        no_of_words=no_of_words,
+        separator=separator,
+        capitalization=capitalization,
+        vocabulary=vocabulary,
+        suffix_length=suffix_length,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def get_pin_generator(length: int = 6, avoid_sequential: bool = False) -> PinCodeGenerator:
+    """Return a shared :class:`PinCodeGenerator` for these arguments."""
+    return PinCodeGenerator(length=length, avoid_sequential=avoid_sequential)
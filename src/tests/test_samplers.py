@@ -0,0 +1,99 @@
+"""
+Uniformity checks for the hand-written random samplers in
+``password_generators``.
+
+The samplers map raw ``secrets.token_bytes`` output through lookup tables
+instead of calling ``secrets.choice`` / ``randbelow``, so a slip in the mask
+or table arithmetic would bias every password without failing loudly.
+
+Run from ``src/``:  python -m unittest discover tests
+"""
+
+import struct
+import unittest
+from collections import Counter
+from unittest import mock
+
+import password_generators as pg
+from password_generators import RandomPasswordGenerator
+
+
+def _accepted(table: bytes, reject: bytes) -> Counter:
+    """How many of the 256 byte values land on each output byte."""
+    return Counter(bytes(range(256)).translate(table, reject))
+
+
+class ByteSamplerTest(unittest.TestCase):
+
+    def test_every_pool_is_uniform(self):
+        for flags in range(1, 16):
+            for exclude_similar in (False, True):
+                pool = RandomPasswordGenerator._alphabet(flags, exclude_similar)
+                with self.subTest(flags=flags, exclude_similar=exclude_similar, size=len(pool)):
+                    counts = _accepted(*RandomPasswordGenerator._byte_sampler(pool))
+                    self.assertEqual(set(counts), set(pool.encode("ascii")))
+                    self.assertEqual(len(set(counts.values())), 1, counts)
+
+    def test_every_pool_size_is_uniform(self):
+        for size in range(1, 95):
+            pool = "".join(map(chr, range(0x21, 0x21 + size)))
+            with self.subTest(size=size):
+                counts = _accepted(*RandomPasswordGenerator._byte_sampler(pool))
+                self.assertEqual(len(counts), size)
+                self.assertEqual(len(set(counts.values())), 1, counts)
+
+    def test_at_least_half_of_all_bytes_are_accepted(self):
+        # _secure_chars over-draws 2x on this guarantee
+        for size in range(1, 95):
+            pool = "".join(map(chr, range(0x21, 0x21 + size)))
+            _, reject = RandomPasswordGenerator._byte_sampler(pool)
+            self.assertLessEqual(len(reject), 128, size)
+
+
+class DigitSamplerTest(unittest.TestCase):
+
+    def test_each_digit_gets_25_bytes(self):
+        counts = _accepted(pg._DIGIT_TABLE, pg._DIGIT_REJECT)
+        self.assertEqual(counts, Counter({d: 25 for d in b"0123456789"}))
+
+    def test_random_digits_length_and_alphabet(self):
+        for n in (0, 1, 6, 64):
+            digits = pg._random_digits(n)
+            self.assertEqual(len(digits), n)
+            self.assertTrue(set(digits) <= set("0123456789"))
+
+
+class BoundedIndicesTest(unittest.TestCase):
+
+    @staticmethod
+    def _draw(r: int, words: list[int]) -> int:
+        """Run _bounded_indices([r]) with token_bytes yielding *words* in order."""
+        chunks = iter(struct.pack("<Q", w) for w in words)
+        with mock.patch.object(pg.secrets, "token_bytes", lambda n: next(chunks)):
+            return pg._bounded_indices([r])[0]
+
+    def test_bucket_edges(self):
+        for r in (3, 7, 10, 62):
+            with self.subTest(r=r):
+                self.assertEqual(self._draw(r, [(1 << 64) - 1]), r - 1)
+                # Bucket i starts at ceil(i * 2**64 / r); stepping r words in
+                # keeps the low half above the rejection threshold
+                for i in range(1, r):
+                    self.assertEqual(self._draw(r, [-(-(i << 64) // r) + r]), i)
+
+    def test_biased_low_words_are_redrawn(self):
+        for r in (3, 7):
+            threshold = (1 << 64) % r
+            with self.subTest(r=r):
+                # x = 0 gives a low half of 0 < threshold, so the next word is used
+                self.assertEqual(self._draw(r, [0, (1 << 64) - 1]), r - 1)
+                self.assertGreater(threshold, 0)
+
+    def test_results_are_in_range(self):
+        ranges = list(range(1, 200))
+        for idx, r in zip(pg._bounded_indices(ranges), ranges):
+            self.assertTrue(0 <= idx < r)
+
+
+if __name__ == "__main__":
+    unittest.main()